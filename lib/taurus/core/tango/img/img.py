@@ -32,7 +32,7 @@ __all__ = ['ImageDevice', 'ImageCounterDevice', 'PyImageViewer', 'ImgGrabber',
 __docformat__ = 'restructuredtext'
 
 
-from taurus.core.taurusbasetypes import TaurusEventType
+from taurus.core.taurusbasetypes import TaurusEventType, _CHANGE_EVT_TYPES
 from taurus.core.tango import TangoDevice
 from taurus.core.util.containers import CaselessDict, CaselessList
 from threading import RLock
@@ -156,7 +156,7 @@ class Falcon(ImageCounterDevice):
 
     def eventReceived(self, evt_src, evt_type, evt_value):
         if evt_src == self.getAttribute("imageformat"):
-            if evt_type in (TaurusEventType.Change, TaurusEventType.Periodic):
+            if evt_type in _CHANGE_EVT_TYPES:
                 self._color = evt_value.value.lower() == "rgb24"
                 return
         ImageCounterDevice.eventReceived(self, evt_src, evt_type, evt_value)
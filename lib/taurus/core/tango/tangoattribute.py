@@ -46,7 +46,8 @@ from taurus.core.taurusattribute import TaurusAttribute
 from taurus.core.taurusbasetypes import (TaurusEventType,
                                          TaurusSerializationMode,
                                          SubscriptionState, TaurusAttrValue,
-                                         DataFormat, DataType)
+                                         DataFormat, DataType,
+                                         _CHANGE_EVT_TYPES)
 from taurus.core.taurusoperation import WriteAttrOperation
 from taurus.core.util.event import EventListener
 from taurus.core.util.log import (debug, taurus4_deprecation,
@@ -64,6 +65,11 @@ from .util.tango_taurus import (description_from_tango,
                                 str_2_obj, data_format_from_tango,
                                 data_type_from_tango)
 
+# enumeration members used when decoding/encoding every value, bound to
+# module globals to save the attribute lookup on the enumeration
+_DF_0D, _DF_1D, _DF_2D = DataFormat._0D, DataFormat._1D, DataFormat._2D
+_DT_INTEGER, _DT_BOOLEAN = DataType.Integer, DataType.Boolean
+
 
 class TangoAttrValue(TaurusAttrValue):
     """A TaurusAttrValue specialization to decode PyTango.DeviceAttribute
@@ -98,15 +104,15 @@ class TangoAttrValue(TaurusAttrValue):
             self.error = PyTango.DevFailed(*p.get_err_stack())
         else:
             # spectra and images can be empty without failing
-            if p.is_empty and self._attrRef.data_format != DataFormat._0D:
+            if p.is_empty and self._attrRef.data_format != _DF_0D:
                 dtype = FROM_TANGO_TO_NUMPY_TYPE.get(
                     self._attrRef._tango_data_type)
-                if self._attrRef.data_format == DataFormat._1D:
+                if self._attrRef.data_format == _DF_1D:
                     shape = (0,)
-                elif self._attrRef.data_format == DataFormat._2D:
+                elif self._attrRef.data_format == _DF_2D:
                     shape = (0, 0)
                 p.value = numpy.empty(shape, dtype=dtype)
-                if not (numerical or self._attrRef.type == DataType.Boolean):
+                if not (numerical or self._attrRef.type == _DT_BOOLEAN):
                     # generate a nested empty list of given shape
                     p.value = []
                     for _ in xrange(len(shape) - 1):
@@ -212,7 +218,7 @@ class TangoAttrValue(TaurusAttrValue):
         """cast value to int if  it is an integer.
         Works on scalar and non-scalar values
         """
-        if self._attrRef.type is None or self._attrRef.type != DataType.Integer:
+        if self._attrRef.type is None or self._attrRef.type != _DT_INTEGER:
             return value
         try:
             return int(value)
@@ -361,7 +367,7 @@ class TangoAttribute(TaurusAttribute):
 
         fmt = self.getDataFormat()
         tgtype = self._tango_data_type
-        if fmt == DataFormat._0D:
+        if fmt == _DF_0D:
             if tgtype == PyTango.CmdArgType.DevDouble:
                 attrvalue = float(magnitude)
             elif tgtype == PyTango.CmdArgType.DevFloat:
@@ -384,7 +390,7 @@ class TangoAttribute(TaurusAttribute):
                 attrvalue = magnitude
             else:
                 attrvalue = str(magnitude)
-        elif fmt in (DataFormat._1D, DataFormat._2D):
+        elif fmt in (_DF_1D, _DF_2D):
             if PyTango.is_int_type(tgtype):
                 # cast to integer because the magnitude conversion gives floats
                 attrvalue = magnitude.astype('int64')
@@ -1108,15 +1114,15 @@ class TangoAttribute(TaurusAttribute):
 
     @taurus4_deprecation(alt='self.data_format')
     def isScalar(self):
-        return self.data_format == DataFormat._0D
+        return self.data_format == _DF_0D
 
     @taurus4_deprecation(alt='self.data_format')
     def isSpectrum(self):
-        return self.data_format == DataFormat._1D
+        return self.data_format == _DF_1D
 
     @taurus4_deprecation(alt='self.data_format')
     def isImage(self):
-        return self.data_format == DataFormat._2D
+        return self.data_format == _DF_2D
 
     @taurus4_deprecation(alt='getMaxDim')
     def getMaxDimX(self, cache=True):
@@ -1342,7 +1348,7 @@ class TangoAttributeEventListener(EventListener):
         attr.addListener(self)
 
     def eventReceived(self, s, t, v):
-        if t not in (TaurusEventType.Change, TaurusEventType.Periodic):
+        if t not in _CHANGE_EVT_TYPES:
             return
         self.fireEvent(v.value)
 
@@ -83,6 +83,10 @@ TaurusEventType = Enumeration(
         'Error'
     ))
 
+# the event types that carry a new value of the model
+_CHANGE_EVT_TYPES = frozenset((TaurusEventType.Change,
+                               TaurusEventType.Periodic))
+
 MatchLevel = Enumeration(
     'MatchLevel', (
         'ANY',
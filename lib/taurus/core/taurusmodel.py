@@ -30,7 +30,6 @@ __all__ = ["TaurusModel"]
 __docformat__ = "restructuredtext"
 
 import weakref
-import operator
 import threading
 
 from .util.log import Logger
@@ -38,6 +37,8 @@ from .util.event import CallableRef, BoundMethodWeakref
 from .taurusbasetypes import TaurusEventType, MatchLevel
 from .taurushelper import Factory
 
+_SEQ_T = (list, tuple)
+
 
 class TaurusModel(Logger):
 
@@ -216,7 +217,7 @@ class TaurusModel(Logger):
     def _getCallableRef(self, listener, cb=None):
         # return weakref.ref(listener, self._listenerDied)
         meth = getattr(listener, 'eventReceived', None)
-        if meth is not None and operator.isCallable(meth):
+        if meth is not None and callable(meth):
             return weakref.ref(listener, cb)
         else:
             return CallableRef(listener, cb)
@@ -274,7 +275,7 @@ class TaurusModel(Logger):
         if listeners is None:
             return
 
-        if not operator.isSequenceType(listeners):
+        if not isinstance(listeners, _SEQ_T):
             listeners = listeners,
 
         for listener in listeners:
@@ -285,9 +286,9 @@ class TaurusModel(Logger):
             if l is None:
                 continue
             meth = getattr(l, 'eventReceived', None)
-            if meth is not None and operator.isCallable(meth):
+            if meth is not None and callable(meth):
                 l.eventReceived(self, event_type, event_value)
-            elif operator.isCallable(l):
+            elif callable(l):
                 l(self, event_type, event_value)
 
     def isWritable(self):
@@ -37,6 +37,13 @@ __all__ = ["EnumException", "Enumeration"]
 
 __docformat__ = "restructuredtext"
 
+try:
+    _STR_T = (str, unicode)
+    _INT_T = (int, long)
+except NameError:  # Python 3
+    _STR_T = (str,)
+    _INT_T = (int,)
+
 
 class EnumException(Exception):
     """Exception thrown by :class:`Enumeration` when trying to declare an
@@ -95,9 +102,9 @@ class Enumeration(object):
                     raise EnumException(
                         "flagable enum does not accept tuple items")
                 x, i = x
-                if not isinstance(x, (str, unicode)):
+                if not isinstance(x, _STR_T):
                     raise EnumException("enum name is not a string: " + str(x))
-                if not isinstance(i, (int, long)):
+                if not isinstance(i, _INT_T):
                     raise EnumException(
                         "enum value is not an integer: " + str(i))
                 if x in uniqueNames:
@@ -111,7 +118,7 @@ class Enumeration(object):
                 reverseLookup[i] = x
         for x in enumList:
             if not isinstance(x, tuple):
-                if not isinstance(x, (str, unicode)):
+                if not isinstance(x, _STR_T):
                     raise EnumException("enum name is not a string: " + str(x))
                 if x in uniqueNames:
                     raise EnumException("enum name is not unique: " + str(x))
@@ -122,6 +129,13 @@ class Enumeration(object):
                 reverseLookup[i] = x
         self.lookup = lookup
         self.reverseLookup = reverseLookup
+        # bind the members as instance attributes so that accessing them
+        # (e.g. Volkswagen.BEETLE) does not need to go through __getattr__.
+        # Names clashing with existing attributes keep being resolved as
+        # before (i.e., only through the dictionary-like access)
+        for x, i in lookup.iteritems():
+            if x not in self.__dict__ and not hasattr(self.__class__, x):
+                self.__dict__[x] = i
         if not no_doc:
             self.__doc_enum()
 
@@ -143,9 +157,9 @@ class Enumeration(object):
         return n
 
     def __getitem__(self, i):
-        if isinstance(i, (int, long)):
+        if isinstance(i, _INT_T):
             return self.whatis(i)
-        elif isinstance(i, (str, unicode)):
+        elif isinstance(i, _STR_T):
             return self.lookup[i]
 
     def __getattr__(self, attr):
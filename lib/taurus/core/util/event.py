@@ -37,10 +37,11 @@ import sys
 import weakref
 import threading
 import time
-import operator
 
 import taurus.core
 
+_SEQ_T = (list, tuple)
+
 
 class BoundMethodWeakref(object):
     """This class represents a weak reference to a method of an object since
@@ -654,7 +655,7 @@ class AttributeEventIterator(object):
             self.connect(attrs)
 
     def connect(self, attrs):
-        if not operator.isSequenceType(attrs):
+        if not isinstance(attrs, _SEQ_T):
             attrs = (attrs,)
         self.disconnect()
         self._attrs = attrs
@@ -681,7 +682,7 @@ class AttributeEventIterator(object):
                   "locked by thread %s" % (curr_th.name, th.name)
 
     def eventReceived(self, s, t, v):
-        if t not in (taurus.core.taurusbasetypes.TaurusEventType.Change, taurus.core.taurusbasetypes.TaurusEventType.Periodic):
+        if t not in taurus.core.taurusbasetypes._CHANGE_EVT_TYPES:
             return
         self.fireEvent(s, v.rvalue)
 
@@ -26,6 +26,10 @@
 """event filters library to be used with
 :meth:`taurus.qt.qtgui.base.TaurusBaseComponent.setFilters`"""
 
+# this module is imported while taurus.core is being initialized, so the
+# taurus.core.taurusbasetypes members are only accessed when filtering
+import taurus.core
+
 
 def IGNORE_ALL(s, t, v):
     '''Will discard all events'''
@@ -34,8 +38,7 @@ def IGNORE_ALL(s, t, v):
 
 def ONLY_CHANGE(s, t, v):
     '''Only change events pass'''
-    from taurus.core import TaurusEventType
-    if t == TaurusEventType.Change:
+    if t == taurus.core.taurusbasetypes.TaurusEventType.Change:
         return s, t, v
     else:
         return None
@@ -43,8 +46,7 @@ def ONLY_CHANGE(s, t, v):
 
 def IGNORE_CHANGE(s, t, v):
     '''Config events are discarded'''
-    from taurus.core import TaurusEventType
-    if t != TaurusEventType.Change:
+    if t != taurus.core.taurusbasetypes.TaurusEventType.Change:
         return s, t, v
     else:
         return None
@@ -52,9 +54,7 @@ def IGNORE_CHANGE(s, t, v):
 
 def ONLY_CHANGE_AND_PERIODIC(s, t, v):
     '''Only change events pass'''
-    from taurus.core import TaurusEventType
-    if t in [TaurusEventType.Change,
-             TaurusEventType.Periodic]:
+    if t in taurus.core.taurusbasetypes._CHANGE_EVT_TYPES:
         return s, t, v
     else:
         return None
@@ -62,9 +62,7 @@ def ONLY_CHANGE_AND_PERIODIC(s, t, v):
 
 def IGNORE_CHANGE_AND_PERIODIC(s, t, v):
     '''Config events are discarded'''
-    from taurus.core import TaurusEventType
-    if t not in [TaurusEventType.Change,
-                 TaurusEventType.Periodic]:
+    if t not in taurus.core.taurusbasetypes._CHANGE_EVT_TYPES:
         return s, t, v
     else:
         return None
@@ -72,8 +70,7 @@ def IGNORE_CHANGE_AND_PERIODIC(s, t, v):
 
 def ONLY_CONFIG(s, t, v):
     '''Only config events pass'''
-    from taurus.core import TaurusEventType
-    if t == TaurusEventType.Config:
+    if t == taurus.core.taurusbasetypes.TaurusEventType.Config:
         return s, t, v
     else:
         return None
@@ -81,8 +78,7 @@ def ONLY_CONFIG(s, t, v):
 
 def IGNORE_CONFIG(s, t, v):
     '''Config events are discarded'''
-    from taurus.core import TaurusEventType
-    if t != TaurusEventType.Config:
+    if t != taurus.core.taurusbasetypes.TaurusEventType.Config:
         return s, t, v
     else:
         return None
@@ -98,8 +94,7 @@ def IGNORE_FAKE(s, t, v):
 
 def ONLY_VALID(s, t, v):
     '''Only events whose quality is VALID pass'''
-    from taurus.core import AttrQuality
-    if t == AttrQuality.ATTR_VALID:
+    if t == taurus.core.taurusbasetypes.AttrQuality.ATTR_VALID:
         return s, t, v
     else:
         return None
@@ -120,9 +115,7 @@ class EventValueMap(dict):
 
     def __call__(self, s, t, v):
         import copy
-        from taurus.core import TaurusEventType, DataType
-
-        if not t in (TaurusEventType.Change, TaurusEventType.Periodic):
+        if t not in taurus.core.taurusbasetypes._CHANGE_EVT_TYPES:
             return s, t, v
         if v is None:
             return s, t, v
@@ -132,7 +125,8 @@ class EventValueMap(dict):
 
         v.value = self.get(v.rvalue, v.rvalue)
 
-        v.type = DataType.from_python_type(type(v.rvalue), v.type)
+        v.type = taurus.core.taurusbasetypes.DataType.from_python_type(
+            type(v.rvalue), v.type)
         return s, t, v
 
 
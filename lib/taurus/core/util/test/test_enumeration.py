@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+
+#############################################################################
+##
+# This file is part of Taurus
+##
+# http://taurus-scada.org
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Taurus is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Taurus is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Taurus.  If not, see <http://www.gnu.org/licenses/>.
+##
+#############################################################################
+
+"""Test for taurus.core.util.enumeration"""
+
+__docformat__ = 'restructuredtext'
+
+from taurus.external import unittest
+from taurus.core.util.enumeration import Enumeration
+from taurus.core.taurusbasetypes import DataType
+
+
+class EnumerationTest(unittest.TestCase):
+    '''Test case for the taurus.core.util.enumeration.Enumeration class'''
+
+    def setUp(self):
+        unittest.TestCase.setUp(self)
+        self.enum = Enumeration('Car', ('JETTA', ('THING', 400), 'PASSAT',
+                                        'keys', 'get', 'lookup'))
+
+    def test_members_as_attributes(self):
+        '''check that the members are instance attributes'''
+        e = self.enum
+        for name in ('JETTA', 'THING', 'PASSAT'):
+            self.assertIn(name, e.__dict__)
+            self.assertEqual(getattr(e, name), e.lookup[name])
+        self.assertEqual(e.THING, 400)
+        self.assertRaises(AttributeError, getattr, e, 'BEETLE')
+
+    def test_clashing_members(self):
+        '''check that members clashing with attributes do not shadow them'''
+        e = self.enum
+        # the methods and attributes are left untouched...
+        self.assertEqual(sorted(e.keys()),
+                         sorted(['JETTA', 'THING', 'PASSAT', 'keys', 'get',
+                                 'lookup']))
+        self.assertEqual(e.get('PASSAT'), e.PASSAT)
+        self.assertIsInstance(e.lookup, dict)
+        # ...and the members are still reachable as items
+        for name in ('keys', 'get', 'lookup'):
+            self.assertIsInstance(e[name], int)
+            self.assertEqual(e.whatis(e[name]), name)
+
+    def test_getitem_and_whatis(self):
+        '''check item access and whatis'''
+        e = self.enum
+        self.assertEqual(e['JETTA'], 0)
+        self.assertEqual(e[0], 'JETTA')
+        self.assertEqual(e[400], 'THING')
+        self.assertEqual(e.whatis(e.PASSAT), 'PASSAT')
+        self.assertRaises(KeyError, e.whatis, 999)
+
+    def test_datatype_from_python_type(self):
+        '''check that the DataType.from_python_type monkey-patch works'''
+        self.assertIn('from_python_type', DataType.__dict__)
+        self.assertEqual(DataType.from_python_type(int), DataType.Integer)
+        self.assertEqual(DataType.from_python_type(float), DataType.Float)
+        self.assertEqual(DataType.from_python_type(bool), DataType.Boolean)
+        self.assertIsNone(DataType.from_python_type(dict))
+
+
+if __name__ == '__main__':
+    unittest.main()
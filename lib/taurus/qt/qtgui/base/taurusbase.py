@@ -42,7 +42,8 @@ from taurus.external.enum import Enum
 import taurus
 from taurus.core.util import eventfilters
 from taurus.core.util.timer import Timer
-from taurus.core.taurusbasetypes import TaurusElementType, TaurusEventType
+from taurus.core.taurusbasetypes import (TaurusElementType, TaurusEventType,
+                                         _CHANGE_EVT_TYPES)
 from taurus.core.taurusattribute import TaurusAttribute
 from taurus.core.taurusdevice import TaurusDevice
 from taurus.core.taurusconfiguration import (TaurusConfiguration,
@@ -1491,7 +1492,7 @@ class TaurusBaseWidget(TaurusBaseComponent):
             text = ''
             if self.getShowText():
                 if isinstance(evt_src, TaurusAttribute):
-                    if evt_type in (TaurusEventType.Change, TaurusEventType.Periodic):
+                    if evt_type in _CHANGE_EVT_TYPES:
                         text = self.displayValue(evt_value.rvalue)
                     elif evt_type == TaurusEventType.Error:
                         text = self.getNoneValue()
@@ -2036,7 +2037,7 @@ class TaurusBaseWritableWidget(TaurusBaseWidget):
 
     def handleEvent(self, src, evt_type, evt_value):
         '''reimplemented from :class:`TaurusBaseWidget`'''
-        if evt_type in (TaurusEventType.Change, TaurusEventType.Periodic):
+        if evt_type in _CHANGE_EVT_TYPES:
             self.emitValueChanged()
 
     def postAttach(self):
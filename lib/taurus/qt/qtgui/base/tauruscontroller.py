@@ -37,7 +37,8 @@ import weakref
 
 from taurus.external.qt import Qt
 
-from taurus.core.taurusbasetypes import DataFormat, TaurusEventType
+from taurus.core.taurusbasetypes import (DataFormat, TaurusEventType,
+                                         _CHANGE_EVT_TYPES)
 
 from taurus.qt.qtgui.util import QT_ATTRIBUTE_QUALITY_PALETTE
 from taurus.qt.qtgui.util import QT_DEVICE_STATE_PALETTE
@@ -100,7 +101,7 @@ class TaurusBaseController(object):
         # update the "_last" values only if the event source is the model
         # (it could be the background...)
         if evt_src == self.modelObj():
-            if evt_type in (TaurusEventType.Change, TaurusEventType.Periodic):
+            if evt_type in _CHANGE_EVT_TYPES:
                 if self._last_value is None:
                     # reset the format so that it gets updated by displayValue
                     self.widget().resetFormat()
@@ -29,7 +29,6 @@ __all__ = ["TaurusLabel"]
 
 __docformat__ = 'restructuredtext'
 
-import operator
 import re
 
 from taurus.core.taurusbasetypes import (TaurusElementType, TaurusEventType,
@@ -49,6 +48,7 @@ _QT_PLUGIN_INFO = {
 
 TaurusModelType = TaurusElementType
 EventType = TaurusEventType
+_SEQ_T = (list, tuple)
 
 
 class TaurusLabelController(TaurusBaseController):
@@ -343,7 +343,7 @@ class TaurusLabel(Qt.QLabel, TaurusBaseWidget):
                 return
             if type(mi_value) == int:
                 mi_value = mi_value,
-            if not operator.isSequenceType(mi_value):
+            if not isinstance(mi_value, _SEQ_T):
                 return
             self._modelIndex = mi_value
         self._modelIndexStr = mi
@@ -29,8 +29,6 @@ __all__ = ["TaurusLCD"]
 
 __docformat__ = 'restructuredtext'
 
-import operator
-
 from taurus.core.taurusbasetypes import (TaurusElementType, TaurusEventType,
                                          AttrQuality, TaurusDevState)
 from taurus.external.qt import Qt
@@ -48,6 +46,7 @@ _QT_PLUGIN_INFO = {
 
 TaurusModelType = TaurusElementType
 EventType = TaurusEventType
+_SEQ_T = (list, tuple)
 
 #-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-~-
 # Controller classes for LCD
@@ -278,7 +277,7 @@ class TaurusLCD(Qt.QLCDNumber, TaurusBaseWidget):
                 return
             if type(mi_value) == int:
                 mi_value = mi_value,
-            if not operator.isSequenceType(mi_value):
+            if not isinstance(mi_value, _SEQ_T):
                 return
             self._modelIndex = mi_value
         self._modelIndexStr = mi
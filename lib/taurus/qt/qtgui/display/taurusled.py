@@ -31,7 +31,6 @@ __all__ = ["TaurusLed"]
 __docformat__ = 'restructuredtext'
 
 import weakref
-import operator
 
 from taurus.external.qt import Qt
 
@@ -46,6 +45,8 @@ _QT_PLUGIN_INFO = {
     'icon': "designer:ledgreen.png",
 }
 
+_SEQ_T = (list, tuple)
+
 
 class _TaurusLedController(object):
 
@@ -347,7 +348,7 @@ class TaurusLed(QLed, TaurusBaseWidget):
                 return
             if type(mi_value) == int:
                 mi_value = mi_value,
-            if not operator.isSequenceType(mi_value):
+            if not isinstance(mi_value, _SEQ_T):
                 return
             self._modelIndex = mi_value
         self._modelIndexStr = mi
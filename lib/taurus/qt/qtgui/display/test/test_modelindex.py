@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+#############################################################################
+##
+# This file is part of Taurus
+##
+# http://taurus-scada.org
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Taurus is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Taurus is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Taurus.  If not, see <http://www.gnu.org/licenses/>.
+##
+#############################################################################
+
+
+"""Unit tests for the modelIndex property of the Taurus display widgets"""
+
+from taurus.external import unittest
+from taurus.test import insertTest
+from taurus.qt.qtgui.test import BaseWidgetTestCase
+from taurus.qt.qtgui.display import TaurusLabel, TaurusLCD, TaurusLed
+
+
+@insertTest(helper_name='checkModelIndex', modelIndex=1, expected=(1,))
+@insertTest(helper_name='checkModelIndex', modelIndex='1', expected=(1,))
+@insertTest(helper_name='checkModelIndex', modelIndex='(1, 2)',
+            expected=(1, 2))
+@insertTest(helper_name='checkModelIndex', modelIndex='[1, 2]',
+            expected=[1, 2])
+@insertTest(helper_name='checkModelIndex', modelIndex='"ab"', expected=None)
+@insertTest(helper_name='checkModelIndex', modelIndex='', expected=None)
+class _ModelIndexTestCase(BaseWidgetTestCase):
+    """
+    Generic tests for the modelIndex property. Inherit from this class *and*
+    unittest.TestCase and set the _klass member
+    """
+
+    def checkModelIndex(self, modelIndex, expected):
+        """Check the value stored for a given modelIndex"""
+        self._widget.setModelIndex(modelIndex)
+        got = self._widget.getModelIndexValue()
+        msg = ('wrong modelIndex value for %r:\n expected: %r\n got: %r' %
+               (modelIndex, expected, got))
+        self.assertEqual(got, expected, msg)
+
+
+class TaurusLabelModelIndexTest(_ModelIndexTestCase, unittest.TestCase):
+    _klass = TaurusLabel
+
+
+class TaurusLCDModelIndexTest(_ModelIndexTestCase, unittest.TestCase):
+    _klass = TaurusLCD
+
+
+class TaurusLedModelIndexTest(_ModelIndexTestCase, unittest.TestCase):
+    _klass = TaurusLed
@@ -59,7 +59,6 @@ import re
 import os
 import subprocess
 import traceback
-import operator
 import types
 
 import Queue
@@ -84,6 +83,8 @@ SynopticSelectionStyle = Enumeration("SynopticSelectionStyle", [
     "OUTLINE",
 ])
 
+_SEQ_T = (list, tuple)
+
 
 def parseTangoUri(name):
     # TODO: Tango-centric
@@ -145,7 +146,7 @@ class TaurusGraphicsUpdateThread(Qt.QThread):
                     break
                 else:
                     continue
-            if not operator.isSequenceType(item):
+            if not isinstance(item, _SEQ_T):
                 item = (item,)
             # @todo: Unless the call to boundingRect() has a side effect, this line is useless..  probably related to todo in _updateView()
             item_rects = [i.boundingRect() for i in item]
@@ -683,7 +684,7 @@ class TaurusGraphicsScene(Qt.QGraphicsScene):
                     SelectionMark = picture
                     SelectionMark.setRect(0, 0, w, h)
                     SelectionMark.hide()
-                elif operator.isCallable(picture):
+                elif callable(picture):
                     SelectionMark = picture()
                 else:
                     if isinstance(picture, Qt.QPixmap):
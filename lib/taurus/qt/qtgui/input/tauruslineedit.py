@@ -34,6 +34,7 @@ from taurus.external.pint import Quantity
 from taurus.qt.qtgui.base import TaurusBaseWritableWidget
 from taurus.qt.qtgui.util import PintValidator
 from taurus.core import DataType, DataFormat, TaurusEventType
+from taurus.core.taurusbasetypes import _CHANGE_EVT_TYPES
 
 __all__ = ["TaurusValueLineEdit"]
 
@@ -119,7 +120,7 @@ class TaurusValueLineEdit(Qt.QLineEdit, TaurusBaseWritableWidget):
                 self.debug('Failed attempt to initialize value: %r', e)
 
         self.setEnabled(evt_type != TaurusEventType.Error)
-        if evt_type in (TaurusEventType.Change, TaurusEventType.Periodic):
+        if evt_type in _CHANGE_EVT_TYPES:
             self._updateValidator(evt_value)
         TaurusBaseWritableWidget.handleEvent(
             self, evt_src, evt_type, evt_value)
@@ -46,6 +46,18 @@ from taurus.core.util.report import TaurusMessageReportHandler
 from taurus.external.qt import Qt
 from taurus.qt.qtgui.util.ui import UILoadable
 
+# the formatter, lexer and style do not change between errors, so they are
+# created only once
+if pygments is None:
+    _HTML_FORMATTER, _PY_TB_LEXER, _PYGMENTS_STYLE = None, None, ""
+else:
+    _HTML_FORMATTER = HtmlFormatter()
+    _PY_TB_LEXER = PythonTracebackLexer()
+    _PYGMENTS_STYLE = _HTML_FORMATTER.get_style_defs()
+
+_HTML_HEADER = '<html><head><style type="text/css">%s</style></head><body>' \
+               % _PYGMENTS_STYLE
+
 
 class TaurusMessageErrorHandler(object):
     """This class is designed to handle a generic error into a
@@ -69,20 +81,13 @@ class TaurusMessageErrorHandler(object):
         msg = "<html><body><pre>%s</pre></body></html>" % error
         msgbox.setDetailedHtml(msg)
 
-        html_orig = '<html><head><style type="text/css">{style}</style>' \
-                    '</head><body>'
         exc_info = "".join(traceback.format_exception(err_type, err_value,
                                                       err_traceback))
-        style = ""
-        if pygments is not None:
-            formatter = HtmlFormatter()
-            style = formatter.get_style_defs()
-        html = html_orig.format(style=style)
+        html = _HTML_HEADER
         if pygments is None:
             html += "<pre>%s</pre>" % exc_info
         else:
-            formatter = HtmlFormatter()
-            html += highlight(exc_info, PythonTracebackLexer(), formatter)
+            html += highlight(exc_info, _PY_TB_LEXER, _HTML_FORMATTER)
         html += "</body></html>"
         msgbox.setOriginHtml(html)
 
@@ -100,18 +105,12 @@ class TangoMessageErrorHandler(TaurusMessageErrorHandler):
         :type error: object"""
 
         msgbox = self._msgbox
-        html_orig = '<html><head><style type="text/css">{style}</style>' \
-                    '</head><body>'
-        style, formatter = "", None
-        if pygments is not None:
-            formatter = HtmlFormatter()
-            style = formatter.get_style_defs()
-        html = html_orig.format(style=style)
+        html = _HTML_HEADER
         for de in err_value:
             e_html = """<pre>{reason}: {desc}</pre>{origin}<hr>"""
             origin, reason, desc = de.origin, de.reason, de.desc
             if reason.startswith("PyDs_") and pygments is not None:
-                origin = highlight(origin, PythonTracebackLexer(), formatter)
+                origin = highlight(origin, _PY_TB_LEXER, _HTML_FORMATTER)
             else:
                 origin = "<pre>%s</pre>" % origin
             html += e_html.format(desc=desc, origin=origin, reason=reason)
@@ -121,11 +120,11 @@ class TangoMessageErrorHandler(TaurusMessageErrorHandler):
 
         exc_info = "".join(traceback.format_exception(err_type, err_value,
                                                       err_traceback))
-        html = html_orig.format(style=style)
+        html = _HTML_HEADER
         if pygments is None:
             html += "<pre>%s</pre>" % exc_info
         else:
-            html += highlight(exc_info, PythonTracebackLexer(), formatter)
+            html += highlight(exc_info, _PY_TB_LEXER, _HTML_FORMATTER)
         html += "</body></html>"
         msgbox.setOriginHtml(html)
 
@@ -144,18 +143,12 @@ class MacroServerMessageErrorHandler(TaurusMessageErrorHandler):
         msg = "<html><body><pre>%s</pre></body></html>" % err_value
         msgbox.setDetailedHtml(msg)
 
-        html_orig = """<html><head><style type="text/css">{style}</style></head><body>"""
         exc_info = "".join(err_traceback)
-        style = ""
-        if pygments is not None:
-            formatter = HtmlFormatter()
-            style = formatter.get_style_defs()
-        html = html_orig.format(style=style)
+        html = _HTML_HEADER
         if pygments is None:
             html += "<pre>%s</pre>" % exc_info
         else:
-            formatter = HtmlFormatter()
-            html += highlight(exc_info, PythonTracebackLexer(), formatter)
+            html += highlight(exc_info, _PY_TB_LEXER, _HTML_FORMATTER)
         html += "</body></html>"
         msgbox.setOriginHtml(html)
 
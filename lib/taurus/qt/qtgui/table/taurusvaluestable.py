@@ -34,7 +34,7 @@ import numpy
 
 import taurus.core
 from taurus.core.taurusbasetypes import (DataFormat, DataType, TaurusEventType,
-                                         TaurusElementType)
+                                         TaurusElementType, _CHANGE_EVT_TYPES)
 from taurus.qt.qtgui.util import PintValidator
 from taurus.qt.qtgui.display import TaurusLabel
 from taurus.qt.qtgui.container import TaurusWidget
@@ -715,9 +715,7 @@ class TaurusValuesTable(TaurusWidget):
         model = self._tableView.model()
         if model is None:
             return
-        if evt_type in (TaurusEventType.Change,
-                        TaurusEventType.Periodic)\
-                and evt_value is not None:
+        if evt_type in _CHANGE_EVT_TYPES and evt_value is not None:
             attr = self.getModelObj()
             model.setAttr(attr)
             model.setWriteMode(self._writeMode)